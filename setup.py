@@ -19,10 +19,17 @@ setup(
         ],
     },
     install_requires=[
-        "flask>=2.0.0",
+        "quart>=0.19.0",
+        "hypercorn",
         "dash>=2.0.0",
         "dash-bootstrap-components",
     ],
+    extras_require={
+        # In-process media probing instead of spawning ffprobe
+        "av": ["av>=10.0"],
+        # Faster JSON for cached loudness measurements
+        "orjson": ["orjson>=3.0"],
+    },
     entry_points={
         "console_scripts": [
             "video2audio=video2audio.cli:main",
@@ -1,14 +1,20 @@
 import os
 import re
+import stat
+import queue
+import shutil
+import asyncio
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from dataclasses import dataclass
-from typing import List, Dict, Optional
+from dataclasses import dataclass, fields, Field
+from typing import List, Dict, Optional, Any, Callable, get_type_hints
 import logging
+import mimetypes
 import urllib.parse
 
-from flask import Flask, render_template, request, jsonify, send_file
-from video2audio.transcoder import Video2Audio
+from quart import Quart, Response, render_template, request, jsonify, send_file
+from video2audio.transcoder import Video2Audio, ConversionJob
 
 
 logging.basicConfig(level=logging.INFO)
@@ -19,28 +25,193 @@ logger = logging.getLogger(__name__)
 # Configuration
 # -------------------------------------------------------------------
 
-UPLOAD_FOLDER = Path("uploads")
-PROCESSING_FOLDER = Path("processing")
-PROCESSED_FOLDER = Path("processed")
+def _private_dir(path: Path) -> Optional[Path]:
+    """
+    Create or reuse a directory only this user can access.
 
-for folder in [UPLOAD_FOLDER, PROCESSING_FOLDER, PROCESSED_FOLDER]:
-    folder.mkdir(exist_ok=True)
+    Returns None if path is a symlink, not a directory, owned by another
+    user, or cannot be created, so a directory planted in a shared
+    location (e.g. /dev/shm) is never used.
+    """
+    try:
+        path.mkdir(mode=0o700, exist_ok=True)
+        st = path.lstat()
+    except OSError:
+        return None
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid():
+        logger.warning(f"⚠️ Not using {path}: not a directory owned by this user")
+        return None
+    if stat.S_IMODE(st.st_mode) != 0o700:
+        path.chmod(0o700)
+    return path
+
+
+def _default_workdir() -> Optional[Path]:
+    """Pick a private tmpfs directory for working files, if there is one."""
+    candidates = []
+    if os.environ.get("XDG_RUNTIME_DIR"):
+        # Per-user tmpfs, already 0700
+        candidates.append(Path(os.environ["XDG_RUNTIME_DIR"]) / "video2audio")
+    shm = Path("/dev/shm")
+    if shm.is_dir() and os.access(shm, os.W_OK):
+        candidates.append(shm / f"video2audio-{os.getuid()}")
+    for candidate in candidates:
+        if _private_dir(candidate) is not None:
+            return candidate
+    return None
+
+
+if os.environ.get("V2A_WORKDIR"):
+    WORKDIR = Path(os.environ["V2A_WORKDIR"])
+    # Disk folder for uploads too large for tmpfs; None when not on tmpfs
+    SPILL_FOLDER = None
+else:
+    TMPFS_WORKDIR = _default_workdir()
+    WORKDIR = TMPFS_WORKDIR or Path(".")
+    SPILL_FOLDER = Path("uploads") if TMPFS_WORKDIR else None
+
+UPLOAD_FOLDER = WORKDIR / "uploads"
+PROCESSING_FOLDER = WORKDIR / "processing"
+PROCESSED_FOLDER = WORKDIR / "processed"
+
+for folder in [UPLOAD_FOLDER, PROCESSING_FOLDER, PROCESSED_FOLDER, SPILL_FOLDER]:
+    if folder is not None:
+        folder.mkdir(parents=True, exist_ok=True)
+
+# Uploads larger than this, or than the free tmpfs space, are written to
+# SPILL_FOLDER on disk instead of being kept in RAM
+TMPFS_MAX_FILE_BYTES = int(os.environ.get("V2A_TMPFS_MAX_BYTES", 256 << 20))
+
+# Internal nginx location mapped to PROCESSED_FOLDER (e.g. "/protected/").
+# When set, downloads are handed to nginx via X-Accel-Redirect.
+ACCEL_REDIRECT_PREFIX = os.environ.get("V2A_ACCEL_REDIRECT")
+
+# Request body limits. Quart defaults to 16 MiB and 60 seconds, far too
+# little for video uploads, so both are unlimited unless set (in bytes
+# and seconds respectively).
+MAX_UPLOAD_BYTES = (int(os.environ["V2A_MAX_UPLOAD_BYTES"])
+                    if os.environ.get("V2A_MAX_UPLOAD_BYTES") else None)
+UPLOAD_TIMEOUT = (int(os.environ["V2A_UPLOAD_TIMEOUT"])
+                  if os.environ.get("V2A_UPLOAD_TIMEOUT") else None)
+
+# Maximum number of files handed to a single ffmpeg invocation
+MAX_BATCH_SIZE = 16
+
+# Conversion workers and how many batches may wait for them.
+# Half the cores leaves headroom for ffmpeg's own decoder threads.
+NUM_WORKERS = max(1, (os.cpu_count() or 1) // 2)
+JOB_QUEUE_SIZE = 8
 
 
 # -------------------------------------------------------------------
 # Helpers
 # -------------------------------------------------------------------
 
+# Runs of disallowed characters and underscores collapse into one "_"
+_UNSAFE_RUN = re.compile(r"[^a-zA-Z0-9.-]+")
+
+
 def clean_filename(filename: str) -> str:
     """Sanitize filenames for saving, processing, and downloading."""
     name, ext = os.path.splitext(filename)
-    name = re.sub(r"[^a-zA-Z0-9._-]", "_", name)
-    name = re.sub(r"_+", "_", name).strip("_")
+    name = _UNSAFE_RUN.sub("_", name).strip("_")
     if not name:
         name = "file"
     return f"{name}{ext.lower()}"
 
 
+def write_upload(stream, destination: Path) -> None:
+    """
+    Copy an uploaded file stream to disk.
+
+    Uploads larger than the form parser's memory limit are spooled to a
+    temporary file. Those are copied in-kernel with copy_file_range or
+    sendfile, so the data never passes through Python buffers. Other
+    streams, and platforms without these calls, use a buffered copy.
+    """
+    # SpooledTemporaryFile only has a real descriptor once rolled to disk
+    on_disk = getattr(stream, "_rolled", True)
+    fd_copy = getattr(os, "copy_file_range", None) or getattr(os, "sendfile", None)
+
+    with open(destination, "wb") as out:
+        if on_disk and fd_copy is not None:
+            start = stream.tell()
+            try:
+                in_fd = stream.fileno()
+                offset = start
+                remaining = os.fstat(in_fd).st_size - offset
+                while remaining > 0:
+                    if fd_copy is os.sendfile:
+                        sent = os.sendfile(out.fileno(), in_fd, offset, remaining)
+                    else:
+                        sent = os.copy_file_range(
+                            in_fd, out.fileno(), remaining, offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+                    remaining -= sent
+                stream.seek(offset)
+                return
+            except (AttributeError, OSError, ValueError) as e:
+                logger.debug(f"In-kernel copy unavailable, falling back: {e}")
+                out.seek(0)
+                out.truncate()
+                stream.seek(start)
+
+        shutil.copyfileobj(stream, out, 1 << 16)
+
+
+def _stream_size(stream) -> Optional[int]:
+    """Return the number of bytes left in a seekable stream."""
+    try:
+        start = stream.tell()
+        size = stream.seek(0, os.SEEK_END) - start
+        stream.seek(start)
+        return size
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def upload_destination(stream, name: str) -> Path:
+    """Choose where to store an upload: tmpfs, or disk if it is too large."""
+    if SPILL_FOLDER is None:
+        return UPLOAD_FOLDER / name
+    size = _stream_size(stream)
+    free = shutil.disk_usage(UPLOAD_FOLDER).free
+    if size is None or size > min(TMPFS_MAX_FILE_BYTES, free):
+        return SPILL_FOLDER / name
+    return UPLOAD_FOLDER / name
+
+
+def upload_path(name: str) -> Path:
+    """Return where an upload was stored."""
+    if SPILL_FOLDER is not None and (SPILL_FOLDER / name).exists():
+        return SPILL_FOLDER / name
+    return UPLOAD_FOLDER / name
+
+
+def delete_files(folder: Path, names) -> List[str]:
+    """
+    Delete the named files directly inside folder.
+
+    A single scandir pass finds the files, so there is no extra stat per
+    name, and names that do not refer to an entry of folder (including
+    paths with separators) are never touched.
+    """
+    to_delete = set(names)
+    deleted = []
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if entry.name not in to_delete:
+                continue
+            try:
+                os.unlink(entry.path)
+                deleted.append(entry.name)
+            except OSError as e:
+                logger.error(f"❌ Failed to delete {entry.name}: {e}")
+    return deleted
+
+
 # -------------------------------------------------------------------
 # Codec Defaults and Validation
 # -------------------------------------------------------------------
@@ -57,12 +228,15 @@ CODEC_DEFAULTS = {
 }
 
 VALID_SAMPLE_RATES = {
-    "mp3": [32000, 44100, 48000],
-    "aac": [44100, 48000],
-    "wav": [44100, 48000, 88200, 96000, 192000],
-    "flac": [44100, 48000, 88200, 96000, 192000],
+    "mp3": frozenset({32000, 44100, 48000}),
+    "aac": frozenset({44100, 48000}),
+    "wav": frozenset({44100, 48000, 88200, 96000, 192000}),
+    "flac": frozenset({44100, 48000, 88200, 96000, 192000}),
 }
 
+# Lossy encoders here only take mono or stereo
+LOSSY_CHANNELS = frozenset({1, 2})
+
 
 def validate_settings(
         codec: str,
@@ -95,12 +269,12 @@ def validate_settings(
         bitrate = defaults["bitrate"]
 
     # Sample rate
-    if samplerate not in VALID_SAMPLE_RATES.get(codec, []):
+    if samplerate not in VALID_SAMPLE_RATES[codec]:
         samplerate = defaults["samplerate"]
 
     # Channels
-    if codec in ["mp3", "aac"]:
-        if channels not in [1, 2]:
+    if not lossless:
+        if channels not in LOSSY_CHANNELS:
             channels = 2
     else:
         if not channels:
@@ -129,6 +303,38 @@ class TranscodeSettings:
     lossless: bool = False
 
 
+@dataclass
+class ProcessingJob:
+    """Batch of uploads queued for conversion with fixed settings."""
+    jobs: Dict[str, ConversionJob]
+    settings: TranscodeSettings
+
+
+def _parse_optional_int(value: Any) -> Optional[int]:
+    try:
+        return int(value) if value else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _settings_parser(field: Field) -> Callable[[Any], Any]:
+    """Build the parser turning a raw request value into a field value."""
+    hint = get_type_hints(TranscodeSettings)[field.name]
+    if hint == Optional[int]:
+        return _parse_optional_int
+    if hint == Optional[str]:
+        return lambda value: str(value) if value else None
+    return lambda value: str(value) if value else field.default
+
+
+# One parser per user-editable field, derived once from the dataclass.
+# "lossless" is not user input; validate_settings derives it from the codec.
+SETTINGS_PARSERS: Dict[str, Callable[[Any], Any]] = {
+    f.name: _settings_parser(f)
+    for f in fields(TranscodeSettings) if f.name != "lossless"
+}
+
+
 # -------------------------------------------------------------------
 # Manager Class
 # -------------------------------------------------------------------
@@ -138,130 +344,325 @@ class TranscodeManager:
 
     def __init__(self, transcoder: Video2Audio):
         self.transcoder = transcoder
-        self.upload_list: List[str] = []
-        self.processing_list: List[str] = []
-        self.processed_list: List[str] = []
+        # Insertion-ordered dicts used as ordered sets: O(1) membership
+        # and removal while keeping the order shown in the UI
+        self.upload_list: Dict[str, None] = {}
+        self.processing_list: Dict[str, None] = {}
+        self.processed_list: Dict[str, None] = {}
         self.settings = TranscodeSettings()
+        # Guards the three lists; reentrant so helpers can nest
+        self._lock = threading.RLock()
+
+        # Bounded queue applies back-pressure instead of spawning
+        # an unbounded number of concurrent ffmpeg processes
+        self.job_queue: queue.Queue[ProcessingJob] = queue.Queue(
+            maxsize=JOB_QUEUE_SIZE)
+        # Shared by queued jobs and direct conversions, so together they
+        # never run more than NUM_WORKERS conversions at once
+        self._slots = threading.BoundedSemaphore(NUM_WORKERS)
+        # Direct conversions wait for a slot here rather than in the
+        # default executor, which upload writes and deletes also use
+        self._direct_executor = ThreadPoolExecutor(
+            max_workers=NUM_WORKERS, thread_name_prefix="convert_now")
+        for _ in range(NUM_WORKERS):
+            threading.Thread(target=self._worker, daemon=True).start()
 
     # -------------------------------
     # Upload Management
     # -------------------------------
-    def save_uploads(self, files) -> List[str]:
+    async def save_uploads(self, files) -> List[str]:
         saved_files = []
         for f in files:
             if f.filename:
                 safe_name = clean_filename(f.filename)
-                filepath = UPLOAD_FOLDER / safe_name
-                f.save(filepath)
-                if safe_name not in self.upload_list:
-                    self.upload_list.append(safe_name)
+                filepath = upload_destination(f.stream, safe_name)
+                # Drop an older upload of the same name from the other folder
+                stale = upload_path(safe_name)
+                await asyncio.to_thread(write_upload, f.stream, filepath)
+                if stale != filepath:
+                    stale.unlink(missing_ok=True)
+                with self._lock:
+                    self.upload_list[safe_name] = None
                 saved_files.append(safe_name)
         return saved_files
 
+    async def convert_uploads(self, files) -> List[str]:
+        """Convert uploads straight from their streams, one at a time."""
+        loop = asyncio.get_running_loop()
+        converted = []
+        for f in files:
+            output_name = await loop.run_in_executor(
+                self._direct_executor, self.convert_upload, f)
+            if output_name:
+                converted.append(output_name)
+        return converted
+
+    def convert_upload(self, f) -> Optional[str]:
+        """Convert an upload straight from its stream, skipping the upload folder."""
+        if not f.filename:
+            return None
+
+        settings = self.settings
+        output_name = clean_filename(
+            f"{Path(clean_filename(f.filename)).stem}.{settings.codec}")
+        output_path = PROCESSED_FOLDER.resolve() / output_name
+
+        self._slots.acquire()
+        try:
+            logger.info(
+                f"🔄 Converting {f.filename} → {output_path}"
+                f" with {settings}")
+            self.transcoder.convert_stream(
+                chunks=f.stream,
+                output_file=output_path,
+                codec=settings.codec,
+                bitrate=None if settings.lossless else settings.bitrate,
+                samplerate=settings.samplerate,
+                channels=settings.channels,
+            )
+            logger.info(f"✅ Done: {output_path}")
+        except Exception as e:
+            logger.error(f"❌ Error converting {f.filename}: {e}")
+            # Drop whatever ffmpeg wrote before failing
+            output_path.unlink(missing_ok=True)
+            return None
+        finally:
+            self._slots.release()
+
+        with self._lock:
+            self.processed_list[output_name] = None
+        return output_name
+
     # -------------------------------
     # Processing Management
     # -------------------------------
-    def start_processing(self, filenames: List[str]) -> None:
-        for f in filenames:
-            if f in self.upload_list:
-                self.upload_list.remove(f)
-                self.processing_list.append(f)
-
-        thread = threading.Thread(target=self._process_files, args=(filenames,))
-        thread.start()
-
-    def _process_files(self, files: List[str]) -> None:
-        for f in files:
-            input_path = UPLOAD_FOLDER.resolve() / f
-            output_ext = self.settings.codec
-            output_name = clean_filename(f"{Path(f).stem}.{output_ext}")
-            output_path = PROCESSED_FOLDER.resolve() / output_name
+    def start_processing(self, filenames: List[str]) -> List[str]:
+        """
+        Queue uploads for conversion without blocking.
+
+        Returns the files that did not fit in the queue; they are put back
+        in the upload list so they can be started again later.
+        """
+        settings = self.settings
+        with self._lock:
+            selected = [
+                f for f in dict.fromkeys(filenames) if f in self.upload_list]
+            for f in selected:
+                del self.upload_list[f]
+                self.processing_list[f] = None
+
+        # Later files win on output name collisions, as with serial overwrites
+        jobs: Dict[str, ConversionJob] = {}
+        for f in selected:
+            output_name = clean_filename(f"{Path(f).stem}.{settings.codec}")
+            jobs[output_name] = ConversionJob(
+                input_file=upload_path(f).resolve(),
+                output_file=PROCESSED_FOLDER.resolve() / output_name)
+
+        superseded = set(selected) - {j.input_file.name for j in jobs.values()}
+        if superseded:
+            self._finish_processing(superseded)
+
+        # Spread the selection over the workers, in batches of bounded size
+        output_names = list(jobs)
+        size = min(MAX_BATCH_SIZE, max(1, -(-len(output_names) // NUM_WORKERS)))
+        for i in range(0, len(output_names), size):
+            batch = {name: jobs[name] for name in output_names[i:i + size]}
+            try:
+                self.job_queue.put_nowait(
+                    ProcessingJob(jobs=batch, settings=settings))
+            except queue.Full:
+                rejected = [jobs[name].input_file.name
+                            for name in output_names[i:]]
+                with self._lock:
+                    for f in rejected:
+                        self.processing_list.pop(f, None)
+                        self.upload_list[f] = None
+                logger.warning(
+                    f"⚠️ Job queue full, {len(rejected)} file(s) not started")
+                return rejected
+        return []
+
+    def _worker(self) -> None:
+        while True:
+            job = self.job_queue.get()
+            try:
+                with self._slots:
+                    self._convert_batch(job.jobs, job.settings)
+            except Exception as e:
+                logger.error(f"❌ Unexpected error in conversion worker: {e}")
+            finally:
+                self._finish_processing(
+                    {j.input_file.name for j in job.jobs.values()})
+                self.job_queue.task_done()
+
+    def _finish_processing(self, files) -> None:
+        with self._lock:
+            for f in files:
+                self.processing_list.pop(f, None)
+
+    def _convert_batch(
+            self,
+            jobs: Dict[str, ConversionJob],
+            settings: TranscodeSettings
+    ) -> None:
+        """Convert jobs with one ffmpeg call, retrying per file on failure."""
+        # Skip bitrate if lossless
+        bitrate = None if settings.lossless else settings.bitrate
+        options = dict(
+            codec=settings.codec,
+            bitrate=bitrate,
+            samplerate=settings.samplerate,
+            channels=settings.channels,
+        )
 
+        # Until settings are applied, unset fields are detected from each
+        # input, which a single batch command cannot do
+        complete = (settings.samplerate is not None
+                    and settings.channels is not None
+                    and (settings.lossless or bitrate is not None))
+        if not complete:
+            logger.info(
+                f"🔄 Converting {len(jobs)} file(s) with detected settings")
+            self._convert_each(jobs, options, auto=True)
+        else:
             try:
                 logger.info(
-                    f"🔄 Converting {input_path} → {output_path}"
-                    f" with {self.settings}")
-
-                # Skip bitrate if lossless
-                bitrate = None if self.settings.lossless else self.settings.bitrate
-
+                    f"🔄 Converting {len(jobs)} file(s) with {settings}")
+                self.transcoder.convert_batch(list(jobs.values()), **options)
+            except Exception as e:
+                logger.warning(
+                    f"⚠️ Batch conversion failed, retrying files one by one: {e}")
+                # Settings are validated, no need to probe
+                self._convert_each(jobs, options, auto=False)
+
+        for output_name, job in jobs.items():
+            if job.output_file.exists():
+                logger.info(f"✅ Done: {job.output_file}")
+                with self._lock:
+                    self.processed_list[output_name] = None
+
+    def _convert_each(
+            self,
+            jobs: Dict[str, ConversionJob],
+            options: Dict[str, Any],
+            auto: bool
+    ) -> None:
+        for job in jobs.values():
+            try:
+                logger.info(
+                    f"🔄 Converting {job.input_file} → {job.output_file}")
                 self.transcoder.convert(
-                    input_file=input_path,
-                    output_file=output_path,
-                    codec=self.settings.codec,
-                    bitrate=bitrate,
-                    samplerate=self.settings.samplerate,
-                    channels=self.settings.channels,
-                    auto=True,
+                    input_file=job.input_file,
+                    output_file=job.output_file,
+                    auto=auto,
+                    **options,
                 )
-                logger.info(f"✅ Done: {output_path}")
             except Exception as e:
-                logger.error(f"❌ Error converting {f}: {e}")
-            finally:
-                if f in self.processing_list:
-                    self.processing_list.remove(f)
-                if output_path.exists() and output_name not in self.processed_list:
-                    self.processed_list.append(output_name)
+                logger.error(
+                    f"❌ Error converting {job.input_file.name}: {e}")
+
+    # -------------------------------
+    # State Snapshots
+    # -------------------------------
+    # Copies are taken under the lock, so callers never iterate a dict
+    # that a worker thread is resizing
+    def get_uploads(self) -> List[str]:
+        with self._lock:
+            return list(self.upload_list)
+
+    def get_processing(self) -> List[str]:
+        with self._lock:
+            return list(self.processing_list)
+
+    def get_processed(self) -> List[str]:
+        with self._lock:
+            return list(self.processed_list)
+
+    def forget_uploads(self, names: List[str]) -> None:
+        with self._lock:
+            for name in names:
+                self.upload_list.pop(name, None)
+
+    def forget_processed(self, names: List[str]) -> None:
+        with self._lock:
+            for name in names:
+                self.processed_list.pop(name, None)
 
     # -------------------------------
     # Settings Management
     # -------------------------------
     def update_settings(self, data: Dict) -> None:
-        validated = validate_settings(
-            codec=data.get("codec", "mp3"),
-            bitrate=data.get("bitrate"),
-            samplerate=int(data["samplerate"]) if data.get("samplerate") else None,
-            channels=int(data["channels"]) if data.get("channels") else None,
-        )
+        validated = validate_settings(**{
+            name: parse(data.get(name))
+            for name, parse in SETTINGS_PARSERS.items()})
+        # A fresh object is swapped in rather than mutated, so queued jobs
+        # and running workers keep a consistent view of their settings
         self.settings = TranscodeSettings(**validated)
         logger.info(f"⚙️ Updated transcoding settings: {self.settings}")
 
 
 # -------------------------------------------------------------------
-# Flask App
+# Quart App
 # -------------------------------------------------------------------
 
-app = Flask(__name__)
+app = Quart(__name__)
+app.config["MAX_CONTENT_LENGTH"] = MAX_UPLOAD_BYTES
+app.config["BODY_TIMEOUT"] = UPLOAD_TIMEOUT
 manager = TranscodeManager(
     Video2Audio(ffmpeg_bin="ffmpeg", ffprobe_bin="ffprobe"))
 
 
 @app.route("/")
-def index():
-    return render_template("index.html")
+async def index():
+    return await render_template("index.html")
 
 
 @app.route("/upload", methods=["POST"])
-def upload():
-    files = request.files.getlist("files[]")
-    manager.save_uploads(files)
-    return jsonify({"files": manager.upload_list})
+async def upload():
+    files = (await request.files).getlist("files[]")
+    form = await request.form
+
+    # Convert right away from the upload stream instead of saving first
+    if form.get("convert_now") == "true":
+        converted = await manager.convert_uploads(files)
+        return jsonify(
+            {"files": manager.get_uploads(), "converted": converted})
+
+    await manager.save_uploads(files)
+    return jsonify({"files": manager.get_uploads()})
 
 
 @app.route("/upload_list")
-def get_upload_list():
-    return jsonify({"files": manager.upload_list})
+async def get_upload_list():
+    return jsonify({"files": manager.get_uploads()})
 
 
 @app.route("/start_processing", methods=["POST"])
-def start_processing():
-    selected_files = request.json.get("files", [])
-    manager.start_processing(selected_files)
-    return jsonify({"processing": manager.processing_list})
+async def start_processing():
+    selected_files = (await request.get_json()).get("files", [])
+    rejected = manager.start_processing(selected_files)
+    if rejected:
+        return jsonify({
+            "error": "Too many files queued, try again later",
+            "rejected": rejected,
+            "processing": manager.get_processing(),
+        }), 503
+    return jsonify({"processing": manager.get_processing()})
 
 
 @app.route("/settings", methods=["POST"])
-def update_settings():
-    manager.update_settings(request.json)
+async def update_settings():
+    manager.update_settings(await request.get_json())
     return jsonify({"status": "ok", "settings": vars(manager.settings)})
 
 
 @app.route("/processed_files")
-def get_processed_files():
-    return jsonify({"files": manager.processed_list})
+async def get_processed_files():
+    return jsonify({"files": manager.get_processed()})
 
 @app.route("/download/<path:filename>")
-def download_file(filename):
+async def download_file(filename):
     """
     Securely serve processed audio files for download.
     Returns a valid file or a JSON error message if not found or inaccessible.
@@ -281,60 +682,61 @@ def download_file(filename):
 
     try:
         logging.info(f"⬇️ Downloading: {safe_name}")
-        return send_file(
+
+        # Let nginx send the file itself, without copying it through Python
+        if ACCEL_REDIRECT_PREFIX:
+            relative = file_path.relative_to(PROCESSED_FOLDER.resolve())
+            mimetype, _ = mimetypes.guess_type(file_path.name)
+            response = Response(
+                "", mimetype=mimetype or "application/octet-stream")
+            response.headers["X-Accel-Redirect"] = (
+                ACCEL_REDIRECT_PREFIX.rstrip("/") + "/"
+                + urllib.parse.quote(relative.as_posix()))
+            response.headers["Content-Disposition"] = (
+                f"attachment; filename=\"{file_path.name}\"")
+            return response
+
+        return await send_file(
             file_path,
             as_attachment=True,
-            download_name=safe_name)
+            attachment_filename=safe_name,
+            conditional=True)
     except Exception as e:
         logging.exception(f"❌ Failed to send {safe_name}: {e}")
         return jsonify({"error": f"Failed to download {safe_name}"}), 500
 
 @app.route('/clear_uploads', methods=['POST'])
-def clear_uploads():
+async def clear_uploads():
     """Delete selected uploaded files (not processed) from disk and list."""
-    files_to_delete = request.json.get("files", [])
-    deleted_files = []
+    files_to_delete = (await request.get_json()).get("files", [])
+    deleted_files = await asyncio.to_thread(
+        delete_files, UPLOAD_FOLDER, files_to_delete)
+    if SPILL_FOLDER is not None:
+        deleted_files += await asyncio.to_thread(
+            delete_files, SPILL_FOLDER, files_to_delete)
 
-    for f in files_to_delete:
-        file_path = UPLOAD_FOLDER / f
-        if file_path.exists():
-            try:
-                file_path.unlink()
-                deleted_files.append(f)
-                if f in manager.upload_list:
-                    manager.upload_list.remove(f)
-            except Exception as e:
-                logger.error(f"❌ Failed to delete {f}: {e}")
+    manager.forget_uploads(deleted_files)
 
     return jsonify(
         {"status": "ok",
          "deleted": deleted_files,
-         "files": manager.upload_list
+         "files": manager.get_uploads()
          })
 
 
 @app.route('/clear_processed', methods=['POST'])
-def clear_processed():
+async def clear_processed():
     """Delete all processed files from disk and update manager list."""
-    deleted_files = []
-
-    for f in manager.processed_list:
-        file_path = PROCESSED_FOLDER / f
-        if file_path.exists():
-            try:
-                file_path.unlink()
-                deleted_files.append(f)
-            except Exception as e:
-                logger.error(f"❌ Failed to delete {f}: {e}")
+    deleted_files = await asyncio.to_thread(
+        delete_files, PROCESSED_FOLDER, manager.get_processed())
 
     # Update manager processed list
-    manager.processed_list = [
-        f for f in manager.processed_list if f not in deleted_files]
+    manager.forget_processed(deleted_files)
 
     return jsonify(
         {"status": "ok",
          "deleted": deleted_files,
-         "files": manager.processed_list
+         "files": manager.get_processed()
          })
 
 
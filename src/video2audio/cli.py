@@ -1,32 +1,66 @@
+import sys
 import argparse
 from pathlib import Path
+from typing import Dict
 from video2audio.transcoder import Video2Audio
 
 
 def main():
     parser = argparse.ArgumentParser(description="Convert video to audio with FFmpeg")
-    parser.add_argument("input", help="Input video file")
-    parser.add_argument("output", help="Output audio file")
+    parser.add_argument("input", nargs="+", help="Input video file(s)")
+    parser.add_argument("output", help="Output audio file, or output directory for several inputs")
     parser.add_argument("--codec", default="mp3", help="Audio codec (default: mp3)")
     parser.add_argument("--bitrate", help="Audio bitrate (e.g., 192k). Use --auto to detect automatically")
     parser.add_argument("--samplerate", type=int, help="Sample rate (e.g., 44100). Use --auto to detect automatically")
     parser.add_argument("--channels", type=int, help="Number of channels (1=mono, 2=stereo). Use --auto to detect automatically")
     parser.add_argument("--loudnorm", action="store_true", help="Enable loudness normalization")
+    parser.add_argument("--two-pass", action="store_true", help="Measure loudness first and normalize linearly (implies --loudnorm)")
     parser.add_argument("--auto", action="store_true", help="Automatically detect best bitrate, samplerate, and channels")
+    parser.add_argument("--hwaccel", nargs="?", const="cuda", metavar="METHOD", help="Hardware-accelerated decoding: cuda (default), vaapi, qsv, videotoolbox, ... or auto")
+    parser.add_argument("--in-process", action="store_true", help="Encode with PyAV in-process instead of running ffmpeg (requires the av extra; --loudnorm still needs the ffmpeg binary)")
+    parser.add_argument("--jobs", type=int, help="Concurrent conversions for several inputs (default: the CPU count, one ffmpeg thread each)")
     args = parser.parse_args()
 
-    transcoder = Video2Audio()
-    transcoder.convert(
-        input_file=Path(args.input),
-        output_file=Path(args.output),
+    transcoder = Video2Audio(hwaccel=args.hwaccel, in_process=args.in_process)
+    options = dict(
         codec=args.codec,
         bitrate=args.bitrate,
         samplerate=args.samplerate,
         channels=args.channels,
-        loudnorm=args.loudnorm,
+        loudnorm=args.loudnorm or args.two_pass,
+        two_pass=args.two_pass,
         auto=args.auto,
     )
-    print(f"✅ Converted {args.input} → {args.output}")
+
+    if len(args.input) == 1:
+        transcoder.convert(
+            input_file=Path(args.input[0]),
+            output_file=Path(args.output),
+            **options,
+        )
+        print(f"✅ Converted {args.input[0]} → {args.output}")
+        return
+
+    output_dir = Path(args.output)
+    # The same file listed twice is converted once
+    inputs = list(dict.fromkeys(Path(f) for f in args.input))
+    outputs = [output_dir / f"{f.stem}.{args.codec}" for f in inputs]
+
+    # Inputs sharing a stem (a/clip.mp4, b/clip.mkv) would overwrite each other
+    claimed: Dict[Path, Path] = {}
+    for input_file, output_file in zip(inputs, outputs):
+        if output_file in claimed:
+            parser.error(
+                f"{claimed[output_file]} and {input_file} would both be "
+                f"written to {output_file}; convert them separately")
+        claimed[output_file] = input_file
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    failures = transcoder.convert_many(
+        inputs, outputs, max_workers=args.jobs, **options)
+    print(f"✅ Converted {len(inputs) - len(failures)} of {len(inputs)} files → {output_dir}")
+    if failures:
+        sys.exit(1)
 
 
 if __name__ == "__main__":
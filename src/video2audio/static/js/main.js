@@ -9,6 +9,7 @@ const processBtn = document.getElementById("process-btn");
 const downloadBtn = document.getElementById("download-btn");
 const clearBtn = document.getElementById("clear-btn");
 const statusDiv = document.getElementById("status");
+const convertNowCheckbox = document.getElementById("convert-now");
 
 // --------------------
 // Utility Functions
@@ -87,16 +88,23 @@ dropZone.addEventListener("drop", e => {
 
 function uploadFiles(files) {
     if (!files.length) return;
-    showStatus("⬆️ Uploading files...", true, true);
+    const convertNow = convertNowCheckbox.checked;
+    showStatus(convertNow ? "🔄 Uploading and converting files..." : "⬆️ Uploading files...", true, true);
 
     const formData = new FormData();
+    formData.append("convert_now", convertNow);
     for (let f of files) formData.append("files[]", f);
 
     fetch("/upload", { method: "POST", body: formData })
         .then(res => res.json())
-        .then(() => {
+        .then(data => {
             refreshUploadList();
-            showStatus("✅ Files uploaded");
+            if (convertNow) {
+                refreshProcessedList();
+                showStatus(`✅ Converted files: ${data.converted.join(", ")}`);
+            } else {
+                showStatus("✅ Files uploaded");
+            }
         })
         .catch(err => {
             console.error(err);
@@ -133,9 +141,14 @@ function startProcessing() {
         headers: { "Content-Type": "application/json" },
         body: JSON.stringify({ files: selected })
     })
-        .then(() => {
+        .then(res => res.json().then(data => ({ ok: res.ok, data })))
+        .then(({ ok, data }) => {
             refreshUploadList();
-            pollProcessingCompletion(selected);
+            if (!ok) {
+                showStatus(`❌ ${data.error}: ${data.rejected.join(", ")}`, false);
+            }
+            const started = ok ? selected : selected.filter(f => !data.rejected.includes(f));
+            if (started.length) pollProcessingCompletion(started);
         })
         .catch(err => {
             console.error(err);
@@ -1,59 +1,355 @@
-import subprocess
+import io
+import os
 import json
+import math
+import stat
+import shutil
+import tempfile
+import subprocess
+import threading
+import functools
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from pathlib import Path
-from typing import Optional, Dict, Any
-from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Optional, Dict, List, Iterable, Sequence, Mapping, Final, BinaryIO
+from dataclasses import dataclass, field
 import logging
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+try:
+    import av
+except ImportError:  # Optional, install with the "av" extra
+    av = None
+
+try:
+    import orjson
+except ImportError:  # Optional, install with the "orjson" extra
+    orjson = None
+
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Kernel buffer size requested for subprocess pipes (1 MiB)
+PIPE_SIZE = 1 << 20
+
+# Bytes of ffmpeg's stderr kept for error messages
+STDERR_TAIL_SIZE = 8192
+
+# Name suffixes of ffmpeg's hardware-backed encoders
+HW_ENCODER_SUFFIXES = (
+    "_nvenc", "_qsv", "_vaapi", "_amf", "_videotoolbox",
+    "_v4l2m2m", "_mf", "_vulkan")
+
+# Demuxer limits for the first, quick probe: read at most 1 MB and
+# analyze at most 1 second of input
+PROBE_LIMITS: Final[Mapping[str, str]] = MappingProxyType({
+    "probesize": "1000000",
+    "analyzeduration": "1000000",
+})
+
+# Lossless input codecs (plus every "pcm_*"); their bitrate is never
+# used, so a missing one is not worth a second probe
+LOSSLESS_CODECS: Final = frozenset({
+    "flac", "alac", "wavpack", "ape", "tta", "truehd", "mlp"})
+
+# EBU R128 loudness target used for normalization
+LOUDNORM_TARGET = "I=-16:TP=-1.5:LRA=11"
+
+# Suffix of the file caching a source's loudness measurement
+LOUDNORM_SIDECAR_SUFFIX = ".loudnorm.json"
+
+# loudnorm's print_format=json keys and the options they feed back into
+_LOUDNORM_MEASURED: Final[Mapping[str, str]] = MappingProxyType({
+    "input_i": "measured_I",
+    "input_tp": "measured_TP",
+    "input_lra": "measured_LRA",
+    "input_thresh": "measured_thresh",
+    "target_offset": "offset",
+})
+
+
+def _enlarge_pipe(pipe) -> None:
+    """Grow a pipe's kernel buffer to PIPE_SIZE where supported (Linux)."""
+    if pipe is None or not hasattr(fcntl, "F_SETPIPE_SZ"):
+        return
+    try:
+        fcntl.fcntl(pipe.fileno(), fcntl.F_SETPIPE_SZ, PIPE_SIZE)
+    except OSError:
+        # Above /proc/sys/fs/pipe-max-size; keep the default size
+        pass
+
+
+@functools.lru_cache(maxsize=None)
+def _which(name: str) -> Optional[str]:
+    """Resolve a program name to an absolute path once per process."""
+    return shutil.which(name)
+
+
+def _spawn(cmd: Sequence[str], **kwargs) -> subprocess.Popen:
+    """
+    Start a child process through posix_spawn where CPython allows it.
+
+    CPython only takes its posix_spawn path when the executable is given
+    with a directory and close_fds is off. Python opens its own file
+    descriptors non-inheritable (PEP 446), so nothing leaks into ffmpeg,
+    and the parent's page tables are never copied by fork(), which adds
+    up when convert_many launches many children from a large process.
+    """
+    return subprocess.Popen(
+        cmd, executable=_which(cmd[0]), close_fds=False, **kwargs)
+
+
+@functools.lru_cache(maxsize=None)
+def _kbps(kbps: int) -> str:
+    """
+    Format a bitrate option such as "192k", reusing the same string.
+
+    Keyed on kilobits rather than bits per second; outputs are capped by
+    the codec's max bitrate, so only a few hundred keys can exist.
+    """
+    return f"{kbps}k"
+
+
+def _json_loads(data: bytes):
+    """Decode JSON from bytes, with orjson when installed."""
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Encode JSON to bytes, with orjson when installed."""
+    return orjson.dumps(obj) if orjson is not None else json.dumps(obj).encode()
+
+
+def _spooled_on_disk(source: tempfile.SpooledTemporaryFile) -> bool:
+    """
+    Whether a SpooledTemporaryFile has already rolled over to disk.
+
+    Its fileno() forces a rollover, so this must be known beforehand.
+    There is no public API for it: the private buffer is inspected,
+    which matches CPython 3.10 through 3.13 (a BytesIO until rollover,
+    a BufferedRandom after). Should that change, the file is treated
+    as in memory and copied through the pipe, never rolled over.
+    """
+    return isinstance(getattr(source, "_file", None), io.BufferedRandom)
+
+
+def _regular_fd(source: BinaryIO) -> Optional[int]:
+    """Return the descriptor of a file object backed by a regular file."""
+    # SpooledTemporaryFile only has a real descriptor once rolled to disk
+    if (isinstance(source, tempfile.SpooledTemporaryFile)
+            and not _spooled_on_disk(source)):
+        return None
+    try:
+        fd = source.fileno()
+        return fd if stat.S_ISREG(os.fstat(fd).st_mode) else None
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _send_file(source: BinaryIO, pipe) -> bool:
+    """
+    Copy the rest of a regular file into a pipe with os.sendfile.
+
+    The data moves in-kernel without passing through Python buffers.
+    Returns False, having written nothing, when the source has no
+    regular-file descriptor or the platform cannot sendfile into a pipe,
+    so the caller can fall back to a buffered copy.
+    """
+    in_fd = _regular_fd(source)
+    if in_fd is None or not hasattr(os, "sendfile"):
+        return False
+    offset = start = source.tell()
+
+    out_fd = pipe.fileno()
+    try:
+        while sent := os.sendfile(out_fd, in_fd, offset, PIPE_SIZE):
+            offset += sent
+    except OSError as e:
+        # Only fall back if sendfile itself is unsupported (e.g. EINVAL
+        # on platforms that cannot write to a pipe); a closed pipe or a
+        # failure mid-copy is a real error
+        if offset != start or isinstance(e, BrokenPipeError):
+            raise
+        logger.debug(f"sendfile into a pipe unavailable, falling back: {e}")
+        return False
+    source.seek(offset)
+    return True
+
+
+def _pairs(inputs: Iterable, outputs: Iterable) -> Iterable[tuple]:
+    """
+    Zip two iterables, raising ValueError if their lengths differ.
+
+    Unlike zip(strict=True), errors raised by the iterables themselves
+    propagate unchanged instead of being mixed up with a length mismatch.
+    """
+    outputs = iter(outputs)
+    missing = object()
+    for item in inputs:
+        output = next(outputs, missing)
+        if output is missing:
+            break
+        yield item, output
+    else:
+        if next(outputs, missing) is missing:
+            return
+    raise ValueError("input_files and output_files must have the same length")
+
+
+def _command_error(cmd: Sequence[str], stderr: bytes) -> RuntimeError:
+    """Build the error raised when a child process exits non-zero."""
+    return RuntimeError(
+        f"Command failed ({' '.join(cmd)}):\n{stderr.decode(errors='replace')}")
+
+
+def _read_tail(file) -> bytes:
+    """Return the last STDERR_TAIL_SIZE bytes written to a file."""
+    size = file.seek(0, os.SEEK_END)
+    file.seek(max(0, size - STDERR_TAIL_SIZE))
+    return file.read()
+
+
+@functools.lru_cache(maxsize=4096)
+def _probe_cached(
+        ffprobe_bin: str,
+        path: str,
+        mtime_ns: int,
+        size: int
+) -> "AudioInfo":
+    """
+    Probe one version of a file once per process.
+
+    Shared by all Video2Audio instances. mtime_ns and size only take
+    part in the cache key, so a file overwritten in place is probed again.
+    """
+    return Video2Audio._probe_file(ffprobe_bin, path)
+
+
+# Per-key locks for probes in flight, so concurrent conversions of the
+# same file wait for one ffprobe run instead of each starting their own.
+# Each entry counts its holder and waiters; the last one out removes it.
+_probe_locks: Dict[tuple, list] = {}
+_probe_locks_guard = threading.Lock()
+
+
+def _probe_once(key: tuple) -> "AudioInfo":
+    """Return _probe_cached(*key), coalescing concurrent cache misses."""
+    with _probe_locks_guard:
+        entry = _probe_locks.setdefault(key, [threading.Lock(), 0])
+        entry[1] += 1
+    try:
+        with entry[0]:
+            return _probe_cached(*key)
+    finally:
+        with _probe_locks_guard:
+            entry[1] -= 1
+            if not entry[1]:
+                del _probe_locks[key]
+
+
+@dataclass(frozen=True)
 class AudioInfo:
     """Structured representation of audio stream information."""
     bitrate: int
     samplerate: int
     channels: int
+    codec_name: Optional[str] = None
+
+
+@dataclass
+class ConversionJob:
+    """Input/output pair converted as part of a batch."""
+    input_file: Path
+    output_file: Path
+
+
+@dataclass(frozen=True, slots=True)
+class CodecSpec:
+    """Capabilities and ffmpeg settings of one output codec."""
+    fmt: str
+    encoder: str
+    lossless: bool
+    default_bitrate: Optional[int]
+    max_bitrate: Optional[int]
+    default_samplerate: int
+    supported_samplerates: frozenset[int]
+    default_channels: int
+    supported_channels: frozenset[int]
+    # Input codec names (as reported by ffprobe) that can be stream-copied,
+    # provided can_copy() also accepts the stream's parameters; e.g. 16-bit
+    # PCM at 22050 Hz is still resampled for WAV
+    copy_from: frozenset[str]
+    # Muxer options, shared by the ffmpeg command and PyAV
+    mux_options: Mapping[str, str] = field(init=False)
+    # The same as ffmpeg arguments, built once instead of per command
+    mux_args: tuple[str, ...] = field(init=False)
+
+    def __post_init__(self) -> None:
+        mux_options = {}
+        if self.fmt == "mp4":
+            # Move the index to the front so MP4 files play while downloading
+            mux_options["movflags"] = "+faststart"
+        mux_args = tuple(
+            arg for name, value in mux_options.items()
+            for arg in (f"-{name}", value))
+        object.__setattr__(self, "mux_options", MappingProxyType(mux_options))
+        object.__setattr__(self, "mux_args", (*mux_args, "-f", self.fmt))
+
+    def can_copy(self, info: "AudioInfo") -> bool:
+        """
+        Whether an input stream can be remuxed as-is into this codec.
+
+        The codec must match and the stream must already satisfy what a
+        re-encode would enforce: a supported sample rate and channel
+        count and, for lossy codecs, a known bitrate within the maximum.
+        """
+        return (info.codec_name in self.copy_from
+                and info.samplerate in self.supported_samplerates
+                and info.channels in self.supported_channels
+                and (self.lossless or 0 < info.bitrate <= self.max_bitrate))
+
 
+# Muxer per codec: AAC must use the mp4 container, not the 'aac' muxer.
+# Encoders match ffmpeg's default for each muxer.
+_CODECS: Final[Mapping[str, CodecSpec]] = MappingProxyType({
+    "mp3": CodecSpec(
+        fmt="mp3", encoder="libmp3lame", lossless=False,
+        default_bitrate=192_000, max_bitrate=320_000,
+        default_samplerate=44100,
+        supported_samplerates=frozenset({32000, 44100, 48000}),
+        default_channels=2, supported_channels=frozenset({1, 2}),
+        copy_from=frozenset({"mp3"})),
+    "aac": CodecSpec(
+        fmt="mp4", encoder="aac", lossless=False,
+        default_bitrate=128_000, max_bitrate=256_000,
+        default_samplerate=48000,
+        supported_samplerates=frozenset({44100, 48000, 96000}),
+        default_channels=2, supported_channels=frozenset({1, 2}),
+        copy_from=frozenset({"aac"})),
+    "wav": CodecSpec(
+        fmt="wav", encoder="pcm_s16le", lossless=True,
+        default_bitrate=None, max_bitrate=None,
+        default_samplerate=44100,
+        supported_samplerates=frozenset({44100, 48000, 96000, 192000}),
+        default_channels=2, supported_channels=frozenset({1, 2, 6, 8}),
+        copy_from=frozenset({"pcm_s16le"})),
+    "flac": CodecSpec(
+        fmt="flac", encoder="flac", lossless=True,
+        default_bitrate=None, max_bitrate=None,
+        default_samplerate=96000,
+        supported_samplerates=frozenset({44100, 48000, 96000, 192000}),
+        default_channels=2, supported_channels=frozenset({1, 2, 6, 8}),
+        copy_from=frozenset({"flac"})),
+})
+
+CHANNEL_LAYOUTS: Final[Mapping[int, str]] = MappingProxyType(
+    {1: "mono", 2: "stereo", 6: "5.1", 8: "7.1"})
 
-class CodecConfig:
-    """Codec-specific capability table."""
-    LOSSY = {"mp3", "aac"}
-    LOSSLESS = {"wav", "flac"}
-
-    MAX_BITRATE = {
-        "mp3": 320_000,
-        "aac": 256_000,
-        "wav": None,
-        "flac": None}
-
-    DEFAULT_BITRATE = {
-        "mp3": 192_000,
-        "aac": 128_000,
-        "wav": None,
-        "flac": None}
-
-    DEFAULT_SAMPLERATE = {
-        "mp3": 44100,
-        "aac": 48000,
-        "wav": 44100,
-        "flac": 96000}
-
-    SUPPORTED_SAMPLERATES = {
-        "mp3": [32000, 44100, 48000],
-        "aac": [44100, 48000, 96000],
-        "wav": [44100, 48000, 96000, 192000],
-        "flac": [44100, 48000, 96000, 192000]}
-
-    DEFAULT_CHANNELS = {
-        "mp3": 2, "aac": 2, "wav": 2, "flac": 2}
-
-    SUPPORTED_CHANNELS = {
-        "mp3": [1, 2],
-        "aac": [1, 2],
-        "wav": [1, 2, 6, 8],
-        "flac": [1, 2, 6, 8]}
 
 class Video2Audio:
     """
@@ -61,50 +357,345 @@ class Video2Audio:
     Provides smart defaults for bitrate, sample rate, and channels.
     """
 
+    # Global options shared by every conversion command; only errors are
+    # logged, so failures stay readable and stderr stays near-empty
+    _BASE_ARGS = ("-nostdin", "-hide_banner", "-loglevel", "error", "-nostats")
+    _LOUDNORM_ARGS = ("-af", f"loudnorm={LOUDNORM_TARGET}")
+    # Fail instead of exiting 0 with an empty file when a piped input
+    # cannot be demuxed (e.g. MP4 with the moov atom at the end)
+    _STREAM_ARGS = ("-abort_on", "empty_output_stream")
+
     def __init__(
             self,
             ffmpeg_bin="ffmpeg",
-            ffprobe_bin="ffprobe"
+            ffprobe_bin="ffprobe",
+            threads: int = 0,
+            hwaccel: bool | str | None = None,
+            in_process: bool = False
     ):
-        self.ffmpeg_bin = ffmpeg_bin
-        self.ffprobe_bin = ffprobe_bin
+        # Resolve the binaries once, so no exec walks $PATH again
+        self.ffmpeg_bin = _which(ffmpeg_bin) or ffmpeg_bin
+        self.ffprobe_bin = _which(ffprobe_bin) or ffprobe_bin
+        for name, resolved in ((ffmpeg_bin, self.ffmpeg_bin),
+                               (ffprobe_bin, self.ffprobe_bin)):
+            if not os.path.isabs(resolved):
+                logger.warning(f"⚠️ {name} not found on PATH")
+        # Decoder, filter and encoder threads per conversion,
+        # 0 lets ffmpeg use all cores
+        self.threads = threads
+
+        # Encode or remux with PyAV inside this process instead of spawning
+        # ffmpeg. Loudness normalization and piped conversions still run
+        # the ffmpeg binary.
+        self.in_process = in_process and av is not None
+        if in_process and av is None:
+            logger.warning(
+                "⚠️ PyAV is not installed, falling back to the ffmpeg binary")
+
+        # Hardware decoding is off by default: with -vn ffmpeg never opens
+        # the video decoder, and initializing a GPU device only adds
+        # startup time. It helps when inputs still get decoded, e.g.
+        # damaged files ffmpeg has to scan. True means "cuda", "auto"
+        # lets ffmpeg pick, other names (vaapi, qsv, videotoolbox, ...)
+        # are checked once against the methods ffmpeg was built with.
+        self.hwaccel_args: list[str] = []
+        if hwaccel is True:
+            hwaccel = "cuda"
+        if hwaccel == "auto":
+            self.hwaccel_args = ["-hwaccel", "auto"]
+        elif hwaccel:
+            if hwaccel in self._detect_hwaccels():
+                self.hwaccel_args = ["-hwaccel", hwaccel]
+                logger.info(
+                    f"🚀 Using {hwaccel} hardware-accelerated decoding")
+            else:
+                logger.info(
+                    f"ℹ️ {hwaccel} not available, decoding on the CPU")
 
     @staticmethod
-    def _run_subprocess(cmd: list[str]) -> subprocess.CompletedProcess:
-        """Run a subprocess command and return the result."""
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        if result.returncode != 0:
-            raise RuntimeError(
-                f"Command failed ({' '.join(cmd)}):\n{result.stderr}"
-            )
-        return result
+    def _run_capture_stdout(cmd: list[str]) -> bytes:
+        """
+        Run a command and return its raw stdout, raising on failure.
+
+        Used for ffprobe and ffmpeg's capability listings. stderr goes to
+        a temporary file, as in _run_silent, so only stdout is read.
+        """
+        with tempfile.TemporaryFile() as log:
+            proc = _spawn(cmd, stdout=subprocess.PIPE, stderr=log)
+            _enlarge_pipe(proc.stdout)
+            stdout, _ = proc.communicate()
+            if proc.returncode != 0:
+                raise _command_error(cmd, _read_tail(log))
+        return stdout
+
+    @staticmethod
+    def _run_silent(cmd: list[str]) -> bytes:
+        """
+        Run a command whose output is not needed, raising on failure.
+
+        stdout is discarded and stderr goes to an unlinked temporary
+        file rather than a pipe. The child never blocks on a reader and
+        the parent makes no read calls while it runs, only waiting for it
+        to exit; the tail is read back once at the end.
+
+        Returns:
+            The last STDERR_TAIL_SIZE bytes of stderr.
+        """
+        with tempfile.TemporaryFile() as log:
+            proc = _spawn(cmd, stdout=subprocess.DEVNULL, stderr=log)
+            proc.wait()
+            stderr = _read_tail(log)
+        if proc.returncode != 0:
+            raise _command_error(cmd, stderr)
+        return stderr
+
+    @functools.cached_property
+    def available_hw_encoders(self) -> set[str]:
+        """Hardware encoders ffmpeg was built with, queried on first use."""
+        try:
+            stdout = self._run_capture_stdout(
+                [self.ffmpeg_bin, "-hide_banner", "-encoders"])
+        except (OSError, RuntimeError) as e:
+            logger.warning(f"⚠️ Could not query ffmpeg encoders: {e}")
+            return set()
+
+        # Encoder lines follow the " ------" separator: "<flags> <name> <desc>"
+        _, _, listing = stdout.decode(errors="replace").partition("------")
+        names = (line.split()[1] for line in listing.splitlines()
+                 if len(line.split()) > 1)
+        return {name for name in names if name.endswith(HW_ENCODER_SUFFIXES)}
+
+    def _detect_hwaccels(self) -> set[str]:
+        """Return the hardware acceleration methods ffmpeg was built with."""
+        try:
+            stdout = self._run_capture_stdout(
+                [self.ffmpeg_bin, "-hide_banner", "-hwaccels"])
+        except (OSError, RuntimeError) as e:
+            logger.warning(f"⚠️ Could not query ffmpeg hwaccels: {e}")
+            return set()
+
+        lines = stdout.decode(errors="replace").splitlines()
+        # First line is the "Hardware acceleration methods:" header
+        return {line.strip() for line in lines[1:] if line.strip()}
+
+    def _get_audio_info(self, input_file: str | os.PathLike) -> AudioInfo:
+        """
+        Return cached audio stream information for a file.
+
+        The cache key includes the modification time and size, so a
+        file that is overwritten in place is probed again.
+
+        Args:
+            input_file: Path to the media file.
+
+        Returns:
+            AudioInfo object with parsed stream details.
+        """
+        path = os.path.realpath(input_file)
+        st = os.stat(path)
+        return _probe_once(
+            (self.ffprobe_bin, path, st.st_mtime_ns, st.st_size))
+
+    def measure_loudness(
+            self,
+            input_file: str | os.PathLike
+    ) -> Optional[Dict[str, str]]:
+        """
+        Measure a file's loudness for two-pass normalization.
+
+        The measurement is cached in a "<input>.loudnorm.json" sidecar
+        keyed on the input's modification time and size, so later
+        conversions of the same file skip this extra decode.
+
+        Args:
+            input_file: Path to the media file.
 
-    def _get_audio_info(self, input_file: str | Path) -> AudioInfo:
+        Returns:
+            loudnorm options holding the measured values, or None if the
+            input has no measurable loudness (e.g. silence).
         """
-        Extract bitrate, sample rate, and channels using ffprobe.
+        input_file = os.fsdecode(input_file)
+        cached = self._read_loudness_sidecar(input_file)
+        if cached is not None:
+            return cached["measured"]
+
+        st = os.stat(input_file)
+        cmd = [
+            self.ffmpeg_bin,
+            # loudnorm prints its JSON summary at the info level
+            "-nostdin", "-hide_banner", "-nostats",
+            *self._build_input_args(input_file),
+            "-vn", "-af", f"loudnorm={LOUDNORM_TARGET}:print_format=json",
+            "-f", "null", "-"]
+        stderr = self._run_silent(cmd)
+
+        # Parse the raw bytes; the summary is the last {...} block
+        summary = _json_loads(stderr[stderr.rindex(b"{"):stderr.rindex(b"}") + 1])
+        measured = {
+            option: summary[key] for key, option in _LOUDNORM_MEASURED.items()}
+        if not all(math.isfinite(float(v)) for v in measured.values()):
+            logger.warning(
+                f"⚠️ No measurable loudness in {input_file},"
+                " using single-pass normalization")
+            measured = None
+
+        try:
+            sidecar = input_file + LOUDNORM_SIDECAR_SUFFIX
+            with open(sidecar + ".tmp", "wb") as f:
+                f.write(_json_dumps({"mtime_ns": st.st_mtime_ns,
+                                     "size": st.st_size,
+                                     "measured": measured}))
+            os.replace(sidecar + ".tmp", sidecar)
+        except OSError:
+            # Read-only source directory; measure again next time
+            pass
+        return measured
+
+    def _loudness_for(
+            self,
+            input_file: str,
+            measure: bool
+    ) -> Optional[Dict[str, str]]:
+        """Return the input's measured loudness, measuring it if asked."""
+        if measure:
+            return self.measure_loudness(input_file)
+        cached = self._read_loudness_sidecar(input_file)
+        return cached["measured"] if cached is not None else None
+
+    @staticmethod
+    def _read_loudness_sidecar(input_file: str) -> Optional[dict]:
+        """Return the loudness sidecar's content if it matches the input."""
+        try:
+            with open(input_file + LOUDNORM_SIDECAR_SUFFIX, "rb") as f:
+                cached = _json_loads(f.read())
+            st = os.stat(input_file)
+        except (OSError, ValueError):
+            return None
+        if (cached.get("mtime_ns"), cached.get("size")) != (
+                st.st_mtime_ns, st.st_size) or "measured" not in cached:
+            return None
+        return cached
+
+    @staticmethod
+    def _probe_file(ffprobe_bin: str, input_file: str) -> AudioInfo:
+        """
+        Extract bitrate, sample rate, and channels from a media file.
+
+        Uses PyAV to read the container header in-process when installed,
+        falling back to an ffprobe subprocess otherwise or on failure.
+        The first probe stops at PROBE_LIMITS. Containers without a
+        per-stream bitrate (Matroska/WebM, FLAC) fall back to the container
+        bitrate when the audio is their only stream. The input is probed
+        again without limits only if that still did not yield a bitrate,
+        as happens with MPEG-TS or damaged files, and never for lossless
+        codecs, whose bitrate is unused.
 
         Args:
+            ffprobe_bin: ffprobe executable used for the fallback.
             input_file: Path to the media file.
 
         Returns:
             AudioInfo object with parsed stream details.
         """
+        # A file ffprobe cannot open at all fails here, without a retry
+        info = Video2Audio._probe_limited(ffprobe_bin, input_file, PROBE_LIMITS)
+        codec_name = info.codec_name or ""
+        if (info.bitrate or codec_name in LOSSLESS_CODECS
+                or codec_name.startswith("pcm_")):
+            return info
+        return Video2Audio._probe_limited(ffprobe_bin, input_file, {})
+
+    @staticmethod
+    def _probe_limited(
+            ffprobe_bin: str,
+            input_file: str,
+            limits: Mapping[str, str]
+    ) -> AudioInfo:
+        """Probe with PyAV or ffprobe, passing the given demuxer limits."""
+        if av is not None:
+            try:
+                return Video2Audio._probe_with_av(input_file, limits)
+            except (av.FFmpegError, IndexError) as e:
+                logger.debug(f"PyAV probe failed, using ffprobe: {e}")
+
+        return Video2Audio._probe_with_ffprobe(ffprobe_bin, input_file, limits)
+
+    @staticmethod
+    def _probe_with_av(
+            input_file: str,
+            limits: Mapping[str, str] = PROBE_LIMITS
+    ) -> AudioInfo:
+        """Read the first audio stream's parameters with PyAV."""
+        with av.open(input_file, options=dict(limits)) as container:
+            stream = container.streams.audio[0]
+            ctx = stream.codec_context
+            # The container bitrate only describes the audio when there
+            # is nothing else in the file
+            bitrate = stream.bit_rate or (
+                container.bit_rate if len(container.streams) == 1 else 0)
+            return AudioInfo(
+                bitrate=bitrate or 0,
+                samplerate=stream.sample_rate or 44100,
+                channels=ctx.channels or 2,
+                # Descriptor name as ffprobe reports it (e.g. "mp3",
+                # not the "mp3float" decoder)
+                codec_name=ctx.codec.canonical_name,
+            )
+
+    @staticmethod
+    def _probe_with_ffprobe(
+            ffprobe_bin: str,
+            input_file: str,
+            limits: Mapping[str, str] = PROBE_LIMITS
+    ) -> AudioInfo:
+        """Read the first audio stream's parameters with ffprobe."""
         cmd = [
-            self.ffprobe_bin,
+            ffprobe_bin,
             "-v", "error",
+            *(arg for key, value in limits.items() for arg in (f"-{key}", value)),
             "-select_streams", "a:0",
-            "-show_entries", "stream=bit_rate,sample_rate,channels",
-            "-of", "json",
-            str(input_file)]
+            # Stop demuxing after the first packet; stream parameters come
+            # from the headers, so scanning the rest of the file is wasted
+            # I/O on large or remote inputs
+            "-read_intervals", "%+#1",
+            "-show_entries",
+            "stream=codec_name,bit_rate,sample_rate,channels"
+            ":format=bit_rate,nb_streams",
+            "-of", "default",
+            input_file]
+
+        # Output is one "key=value" line per entry inside [STREAM] and
+        # [FORMAT] sections; no JSON document to decode
+        stdout = Video2Audio._run_capture_stdout(cmd).decode(errors="replace")
+        sections: Dict[str, Dict[str, str]] = {}
+        section: Dict[str, str] = {}
+        for line in stdout.splitlines():
+            if line.startswith("[/"):
+                continue
+            if line.startswith("["):
+                section = sections.setdefault(line.strip("[]"), {})
+            elif "=" in line:
+                key, value = line.split("=", 1)
+                section[key] = value
+        stream = sections.get("STREAM", {})
+        fmt = sections.get("FORMAT", {})
 
-        result = self._run_subprocess(cmd)
-        info = json.loads(result.stdout)
-        stream: Dict[str, Any] = info.get("streams", [{}])[0]
+        def to_int(entries: Dict[str, str], key: str, default: int) -> int:
+            value = entries.get(key, "")
+            return int(value) if value.isdigit() else default
 
+        # The container bitrate only describes the audio when there is
+        # nothing else in the file
+        bitrate = to_int(stream, "bit_rate", 0)
+        if not bitrate and to_int(fmt, "nb_streams", 0) == 1:
+            bitrate = to_int(fmt, "bit_rate", 0)
+
+        codec_name = stream.get("codec_name")
         return AudioInfo(
-            bitrate=int(stream.get("bit_rate", 0) or 0),
-            samplerate=int(stream.get("sample_rate", 44100)),
-            channels=int(stream.get("channels", 2)),
+            bitrate=bitrate,
+            samplerate=to_int(stream, "sample_rate", 44100),
+            channels=to_int(stream, "channels", 2),
+            codec_name=codec_name if codec_name not in (None, "N/A") else None,
         )
 
     @staticmethod
@@ -119,19 +710,20 @@ class Video2Audio:
         Returns:
             Bitrate string (e.g., "192k") or None for lossless/uncompressed codecs.
         """
-        max_bitrate = CodecConfig.MAX_BITRATE.get(codec)
-        default_bitrate = CodecConfig.DEFAULT_BITRATE.get(codec)
+        spec = _CODECS[codec]
+        max_bitrate = spec.max_bitrate
+        default_bitrate = spec.default_bitrate
 
-        if codec in CodecConfig.LOSSLESS:
+        if spec.lossless:
             return None
         if input_bitrate <= 0:
-            return f"{default_bitrate // 1000}k" if default_bitrate else None
+            return _kbps(default_bitrate // 1000) if default_bitrate else None
 
         if default_bitrate and input_bitrate < default_bitrate:
-            return f"{default_bitrate // 1000}k"
+            return _kbps(default_bitrate // 1000)
 
         if max_bitrate:
-            return f"{min(input_bitrate, max_bitrate) // 1000}k"
+            return _kbps(min(input_bitrate, max_bitrate) // 1000)
 
         return None  # For lossless/uncompressed
 
@@ -142,81 +734,292 @@ class Video2Audio:
             channels: int
     ):
         """Ensure valid samplerate/channels for given codec."""
-        sr_list = CodecConfig.SUPPORTED_SAMPLERATES[codec]
-        ch_list = CodecConfig.SUPPORTED_CHANNELS[codec]
-        if samplerate not in sr_list:
-            samplerate = CodecConfig.DEFAULT_SAMPLERATE[codec]
-        if channels not in ch_list:
-            channels = CodecConfig.DEFAULT_CHANNELS[codec]
+        spec = _CODECS[codec]
+        if samplerate not in spec.supported_samplerates:
+            samplerate = spec.default_samplerate
+        if channels not in spec.supported_channels:
+            channels = spec.default_channels
         return samplerate, channels
 
-    def _build_ffmpeg_command(
+    def _build_output_args(
             self,
-            input_file: Path,
-            output_file: Path,
+            output_file: str,
             codec: str,
             bitrate: Optional[str],
             samplerate: Optional[int],
             channels: Optional[int],
             loudnorm: bool,
-            overwrite: bool
+            input_index: Optional[int] = None,
+            copy: bool = False,
+            threads: Optional[int] = None,
+            loudness: Optional[Dict[str, str]] = None
     ) -> list[str]:
-        """Construct the ffmpeg command for audio conversion."""
-        cmd = [self.ffmpeg_bin]
-        if overwrite:
-            cmd.append("-y")
+        """
+        Construct the per-output part of an ffmpeg command.
 
-        cmd += ["-i", str(input_file), "-vn"]
+        Args:
+            output_file: Path to the generated audio.
+            codec: Output audio codec.
+            bitrate: Optional bitrate (e.g., "128k").
+            samplerate: Optional sample rate in Hz.
+            channels: Optional number of audio channels.
+            loudnorm: Whether to apply EBU R128 loudness normalization.
+            input_index: Input to map the audio stream from. If None,
+                ffmpeg's default stream selection is used.
+            copy: Remux the input audio stream as-is instead of
+                re-encoding it. Filters and audio parameters are ignored.
+            threads: Encoder threads, defaults to the instance setting.
+            loudness: Measured loudness from measure_loudness(). With
+                loudnorm, normalization is then applied linearly in a
+                single pass instead of by dynamic compression.
 
+        Returns:
+            Output options followed by the output path.
+        """
         # ------------------------------------------------------------
         # Codec and container handling
         # ------------------------------------------------------------
-        # Map logical codec to correct FFmpeg format/container
-        # (AAC must use mp4 container, not 'aac' muxer)
-        format_map = {
-            "mp3": "mp3",
-            "aac": "mp4",
-            "wav": "wav",
-            "flac": "flac"
-        }
-        fmt = format_map.get(codec, codec)
+        spec = _CODECS[codec]
 
-        # ------------------------------------------------------------
-        # Audio filters
-        # ------------------------------------------------------------
-        if loudnorm:
-            cmd += ["-af", "loudnorm=I=-16:TP=-1.5:LRA=11"]
+        if copy:
+            audio_args = ("-c:a", "copy")
+        else:
+            # --------------------------------------------------------
+            # Parameter validation
+            # --------------------------------------------------------
+            # Clamp samplerate for lossy codecs (MP3/AAC)
+            if not spec.lossless and samplerate and samplerate > 48000:
+                logger.warning(
+                    f"⚠️ {codec.upper()} supports ≤ 48000 Hz."
+                    f" Using 48000 instead of {samplerate}.")
+                samplerate = 48000
 
-        # ------------------------------------------------------------
-        # Parameter validation
-        # ------------------------------------------------------------
-        # Clamp samplerate for lossy codecs (MP3/AAC)
-        if codec in ["mp3", "aac"] and samplerate and samplerate > 48000:
-            logger.warning(
-                f"⚠️ {codec.upper()} supports ≤ 48000 Hz."
-                f" Using 48000 instead of {samplerate}.")
-            samplerate = 48000
+            # Skip bitrate for lossless formats (WAV, FLAC)
+            if spec.lossless:
+                bitrate = None
 
-        # Skip bitrate for lossless formats (WAV, FLAC)
-        if codec in ["wav", "flac"]:
-            bitrate = None
+            # --------------------------------------------------------
+            # Audio filters + parameters
+            # --------------------------------------------------------
+            audio_args = (
+                *(self._loudnorm_args(loudness) if loudnorm else ()),
+                *(("-ar", str(samplerate)) if samplerate else ()),
+                *(("-ac", str(channels)) if channels else ()),
+                *(("-b:a", bitrate) if bitrate else ()),
+            )
 
-        # ------------------------------------------------------------
-        # Audio parameters
-        # ------------------------------------------------------------
-        if samplerate:
-            cmd += ["-ar", str(samplerate)]
-        if channels:
-            cmd += ["-ac", str(channels)]
-        if bitrate and codec in ["mp3", "aac"]:
-            cmd += ["-b:a", bitrate]
+        return [
+            *(("-map", f"{input_index}:a:0")
+              if input_index is not None else ()),
+            "-vn",
+            "-threads", str(self.threads if threads is None else threads),
+            *audio_args,
+            "-map_metadata", "0" if input_index is None else str(input_index),
+            *spec.mux_args, output_file,
+        ]
 
-        # ------------------------------------------------------------
-        # Metadata + Output
-        # ------------------------------------------------------------
-        cmd += ["-map_metadata", "0", "-f", fmt, str(output_file)]
+    def _loudnorm_args(
+            self,
+            loudness: Optional[Dict[str, str]]
+    ) -> tuple[str, ...]:
+        """Construct the loudnorm filter, using measured values if given."""
+        if not loudness:
+            return self._LOUDNORM_ARGS
+        measured = ":".join(f"{k}={v}" for k, v in loudness.items())
+        return ("-af", f"loudnorm={LOUDNORM_TARGET}:{measured}:linear=true")
+
+    def _build_input_args(
+            self,
+            input_file: str,
+            threads: Optional[int] = None
+    ) -> tuple[str, ...]:
+        """Construct the options and path for one ffmpeg input."""
+        threads = self.threads if threads is None else threads
+        return (*self.hwaccel_args,
+                "-threads", str(threads), "-i", input_file)
+
+    def _build_global_args(
+            self,
+            overwrite: bool,
+            threads: Optional[int] = None
+    ) -> tuple[str, ...]:
+        """Construct the options placed before the first input."""
+        threads = str(self.threads if threads is None else threads)
+        return (
+            self.ffmpeg_bin,
+            *self._BASE_ARGS,
+            # Without these, loudnorm's filter graph spawns one thread per
+            # core even when convert_many already runs a job per core
+            "-filter_threads", threads,
+            "-filter_complex_threads", threads,
+            *(("-y",) if overwrite else ()),
+        )
+
+    def _build_ffmpeg_command(
+            self,
+            input_file: str,
+            output_file: str,
+            codec: str,
+            bitrate: Optional[str],
+            samplerate: Optional[int],
+            channels: Optional[int],
+            loudnorm: bool,
+            overwrite: bool,
+            copy: bool = False,
+            threads: Optional[int] = None,
+            loudness: Optional[Dict[str, str]] = None
+    ) -> list[str]:
+        """Construct the ffmpeg command for audio conversion."""
+        return [
+            *self._build_global_args(overwrite, threads),
+            *self._build_input_args(input_file, threads),
+            *self._build_output_args(
+                output_file, codec, bitrate, samplerate, channels, loudnorm,
+                copy=copy, threads=threads, loudness=loudness),
+        ]
+
+    def _build_batch_command(
+            self,
+            jobs: List[tuple[str, str]],
+            codec: str,
+            bitrate: Optional[str],
+            samplerate: Optional[int],
+            channels: Optional[int],
+            loudnorm: bool,
+            overwrite: bool,
+            loudness: Optional[List[Optional[Dict[str, str]]]] = None
+    ) -> list[str]:
+        """Construct one ffmpeg command converting all (input, output) pairs."""
+        cmd = list(self._build_global_args(overwrite))
+        for input_file, _ in jobs:
+            cmd.extend(self._build_input_args(input_file))
+        for index, (_, output_file) in enumerate(jobs):
+            cmd.extend(self._build_output_args(
+                output_file, codec, bitrate, samplerate, channels,
+                loudnorm, input_index=index,
+                loudness=loudness[index] if loudness else None))
         return cmd
 
+    @staticmethod
+    def _encoder_format(supported, source) -> str:
+        """
+        Pick the sample format to encode in, as ffmpeg's negotiation does.
+
+        Keeps the decoded format when the encoder accepts it, then its
+        planar or packed variant, and otherwise the widest supported
+        format, so e.g. 24-bit FLAC is not cut to 16 bits.
+        """
+        names = [fmt.name for fmt in supported]
+        if source is not None:
+            for candidate in (source.name, source.planar.name, source.packed.name):
+                if candidate in names:
+                    return candidate
+        # max() keeps the encoder's preferred order among equal widths
+        return max(supported, key=lambda fmt: fmt.bytes).name
+
+    @staticmethod
+    def _convert_in_process(
+            input_file: str,
+            output_file: str,
+            codec: str,
+            bitrate: Optional[str],
+            samplerate: int,
+            channels: int,
+            overwrite: bool
+    ) -> None:
+        """
+        Decode, resample and encode the first audio stream with PyAV.
+
+        Follows the ffmpeg command built by _build_output_args (codec,
+        clamping, muxer options and sample format choice) without spawning
+        a process, so codec libraries stay loaded between files.
+        Loudness normalization is not supported on this path.
+        """
+        if not overwrite and os.path.exists(output_file):
+            raise FileExistsError(f"Output file exists: {output_file}")
+
+        # Same clamping as the ffmpeg command
+        spec = _CODECS[codec]
+        if not spec.lossless and samplerate > 48000:
+            samplerate = 48000
+        if spec.lossless:
+            bitrate = None
+
+        layout = CHANNEL_LAYOUTS.get(channels, "stereo")
+        try:
+            with av.open(input_file) as source, av.open(
+                    output_file, "w",
+                    format=spec.fmt,
+                    options=dict(spec.mux_options)) as target:
+                target.metadata.update(source.metadata)
+                in_stream = source.streams.audio[0]
+                out_stream = target.add_stream(
+                    spec.encoder, rate=samplerate, layout=layout)
+                if bitrate:
+                    out_stream.bit_rate = int(bitrate.rstrip("k")) * 1000
+
+                sample_format = Video2Audio._encoder_format(
+                    out_stream.codec_context.codec.audio_formats,
+                    in_stream.codec_context.format)
+                out_stream.codec_context.format = sample_format
+                resampler = av.AudioResampler(
+                    format=sample_format,
+                    layout=layout,
+                    rate=samplerate)
+
+                def encode(frames):
+                    for frame in frames:
+                        target.mux(out_stream.encode(frame))
+
+                for frame in source.decode(in_stream):
+                    encode(resampler.resample(frame))
+                # Flush resampler, then encoder
+                encode(resampler.resample(None))
+                target.mux(out_stream.encode(None))
+        except (av.FFmpegError, IndexError) as e:
+            raise RuntimeError(
+                f"In-process conversion of {input_file} failed: {e}") from e
+
+    @staticmethod
+    def _remux_in_process(
+            input_file: str,
+            output_file: str,
+            codec: str,
+            overwrite: bool
+    ) -> None:
+        """
+        Copy the first audio stream into a new container with PyAV.
+
+        The in-process counterpart of the "-c:a copy" command: packets are
+        demuxed and muxed again without decoding.
+        """
+        if not overwrite and os.path.exists(output_file):
+            raise FileExistsError(f"Output file exists: {output_file}")
+
+        spec = _CODECS[codec]
+        try:
+            with av.open(input_file) as source, av.open(
+                    output_file, "w",
+                    format=spec.fmt,
+                    options=dict(spec.mux_options)) as target:
+                target.metadata.update(source.metadata)
+                in_stream = source.streams.audio[0]
+                # PyAV < 13.1 only has the template argument
+                if hasattr(target, "add_stream_from_template"):
+                    out_stream = target.add_stream_from_template(in_stream)
+                else:
+                    out_stream = target.add_stream(template=in_stream)
+
+                for packet in source.demux(in_stream):
+                    # The demuxer ends with an empty flush packet
+                    if packet.dts is None:
+                        continue
+                    packet.stream = out_stream
+                    target.mux(packet)
+        except (av.FFmpegError, IndexError) as e:
+            raise RuntimeError(
+                f"In-process remux of {input_file} failed: {e}") from e
+
     def convert(
             self,
             input_file: str | Path,
@@ -227,7 +1030,9 @@ class Video2Audio:
             channels: Optional[int] = None,
             loudnorm: bool = False,
             overwrite: bool = True,
-            auto: bool = True
+            auto: bool = True,
+            threads: Optional[int] = None,
+            two_pass: bool = False
     ) -> None:
         """
         Convert a video file to audio with codec-aware defaults.
@@ -241,21 +1046,289 @@ class Video2Audio:
             channels: Optional number of audio channels.
             loudnorm: Whether to apply EBU R128 loudness normalization.
             overwrite: Overwrite existing files if True.
-            auto: Auto-detect settings from input if True.
+            auto: Auto-detect settings from input if True. If the input
+                audio already uses the target codec with parameters it
+                supports (see CodecSpec.can_copy) and no parameter or
+                filter was requested, the stream is copied without
+                re-encoding.
+            threads: ffmpeg threads for this conversion, defaults to the
+                instance setting.
+            two_pass: With loudnorm, measure the input's loudness first
+                (see measure_loudness) and normalize linearly. A cached
+                measurement is used whenever one exists, even if False.
         """
-        input_file, output_file = Path(input_file), Path(output_file)
+        # Plain strings from here on: they go straight into argv
+        input_file, output_file = os.fsdecode(input_file), os.fsdecode(output_file)
 
         if auto:
             audio_info = self._get_audio_info(input_file)
+            if (_CODECS[codec].can_copy(audio_info)
+                    and not (bitrate or samplerate or channels or loudnorm)):
+                logger.info(
+                    f"⏩ Input audio is already {codec}, copying stream")
+                if self.in_process:
+                    self._remux_in_process(
+                        input_file, output_file, codec, overwrite)
+                    return
+                cmd = self._build_ffmpeg_command(
+                    input_file, output_file,
+                    codec, None, None, None, False,
+                    overwrite, copy=True, threads=threads
+                )
+                self._run_silent(cmd)
+                return
+
             bitrate = bitrate or self._determine_bitrate(codec, audio_info.bitrate)
             samplerate = samplerate or audio_info.samplerate
             channels = channels or audio_info.channels
 
         samplerate, channels = self._validate_params(codec, samplerate, channels)
+        if self.in_process and not loudnorm:
+            self._convert_in_process(
+                input_file, output_file,
+                codec, bitrate, samplerate, channels, overwrite)
+            return
+
+        loudness = None
+        if loudnorm:
+            loudness = self._loudness_for(input_file, measure=two_pass)
+
         cmd = self._build_ffmpeg_command(
             input_file, output_file,
             codec, bitrate, samplerate, channels, loudnorm,
+            overwrite, threads=threads, loudness=loudness
+        )
+
+        self._run_silent(cmd)
+
+    def convert_batch(
+            self,
+            jobs: List[ConversionJob],
+            codec: str = "mp3",
+            bitrate: Optional[str] = None,
+            samplerate: Optional[int] = None,
+            channels: Optional[int] = None,
+            loudnorm: bool = False,
+            overwrite: bool = True
+    ) -> None:
+        """
+        Convert several files sharing the same settings with one ffmpeg run.
+
+        All inputs are opened by a single ffmpeg process, which writes one
+        output per input. This avoids paying process startup and codec
+        initialization once per file. No ffprobe detection is performed,
+        so settings should already be validated by the caller. Loudness
+        is not measured either, but cached measurements are used.
+
+        Args:
+            jobs: Input/output pairs to convert.
+            codec: Output audio codec.
+            bitrate: Optional manual bitrate (e.g., "128k").
+            samplerate: Optional sample rate in Hz.
+            channels: Optional number of audio channels.
+            loudnorm: Whether to apply EBU R128 loudness normalization.
+            overwrite: Overwrite existing files if True.
+        """
+        if not jobs:
+            return
+
+        pairs = [
+            (os.fsdecode(job.input_file), os.fsdecode(job.output_file))
+            for job in jobs]
+
+        samplerate, channels = self._validate_params(codec, samplerate, channels)
+        if self.in_process and not loudnorm:
+            for input_file, output_file in pairs:
+                self._convert_in_process(
+                    input_file, output_file,
+                    codec, bitrate, samplerate, channels, overwrite)
+            return
+
+        loudness = None
+        if loudnorm:
+            loudness = [
+                self._loudness_for(input_file, measure=False)
+                for input_file, _ in pairs]
+
+        cmd = self._build_batch_command(
+            pairs,
+            codec, bitrate, samplerate, channels, loudnorm,
+            overwrite, loudness=loudness
+        )
+
+        self._run_silent(cmd)
+
+    def convert_many(
+            self,
+            input_files: Iterable[str | Path],
+            output_files: Iterable[str | Path],
+            max_workers: Optional[int] = None,
+            threads_per_job: int = 1,
+            **kwargs
+    ) -> Dict[Path, Exception]:
+        """
+        Convert many files concurrently, one ffmpeg process per file.
+
+        Conversions run on a thread pool. Each worker only waits on its
+        ffmpeg child process, which releases the GIL, so conversions
+        scale with the number of cores. Inputs are consumed lazily and at
+        most twice max_workers conversions are queued at once, so memory
+        stays flat for very long (or generated) input lists. A failing
+        file does not stop the others; its exception is returned instead.
+
+        Args:
+            input_files: Paths to the source videos.
+            output_files: Paths to the generated audio, one per input.
+                Lengths are checked up front when both are sequences,
+                otherwise when either runs out.
+            max_workers: Concurrent conversions, defaults to the CPU
+                count divided by threads_per_job (by 1 when it is 0).
+            threads_per_job: ffmpeg threads per conversion, 0 lets ffmpeg
+                decide as for Video2Audio(threads=0). Keeping
+                max_workers * threads_per_job near the core count avoids
+                oversubscribing the CPU.
+            **kwargs: Options passed to convert() for every file, except
+                threads, which threads_per_job replaces.
+
+        Returns:
+            Mapping of input path to the exception raised for it, empty
+            if every conversion succeeded.
+        """
+        if (isinstance(input_files, Sequence)
+                and isinstance(output_files, Sequence)
+                and len(input_files) != len(output_files)):
+            raise ValueError(
+                "input_files and output_files must have the same length")
+
+        if "threads" in kwargs:
+            raise TypeError(
+                "convert_many() takes threads_per_job instead of threads")
+        if threads_per_job < 0:
+            raise ValueError(
+                f"threads_per_job must be 0 or more, got {threads_per_job}")
+        if max_workers is None:
+            max_workers = max(
+                1, (os.cpu_count() or 1) // max(1, threads_per_job))
+
+        failures: Dict[Path, Exception] = {}
+        pending: Dict = {}
+
+        def collect(done) -> None:
+            for future in done:
+                input_file = pending.pop(future)
+                error = future.exception()
+                if error is not None:
+                    logger.error(f"❌ Error converting {input_file}: {error}")
+                    failures[input_file] = error
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            try:
+                for input_file, output_file in _pairs(input_files, output_files):
+                    # Keep the window full without materializing every future
+                    if len(pending) >= 2 * max_workers:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        collect(done)
+                    future = pool.submit(
+                        self.convert, input_file, output_file,
+                        threads=threads_per_job, **kwargs)
+                    pending[future] = Path(input_file)
+            finally:
+                # Also reached on a length mismatch: let started work finish
+                collect(wait(pending).done)
+        return failures
+
+    def convert_stream(
+            self,
+            chunks: Iterable[bytes] | BinaryIO,
+            output_file: str | Path,
+            codec: str = "mp3",
+            bitrate: Optional[str] = None,
+            samplerate: Optional[int] = None,
+            channels: Optional[int] = None,
+            loudnorm: bool = False,
+            overwrite: bool = True
+    ) -> None:
+        """
+        Convert media fed through ffmpeg's stdin, without an input path.
+
+        The input is not probed, so settings are not auto-detected.
+        A file object backed by a regular file and positioned at its
+        start is handed to ffmpeg as its stdin descriptor ("fd:"), so
+        ffmpeg can seek in it. Anything else is piped, and containers
+        that need seeking to find their index (e.g. MP4 files with the
+        moov atom at the end) cannot be decoded from a pipe; ffmpeg is
+        told to fail rather than write an empty output.
+
+        Args:
+            chunks: Iterable yielding the raw bytes of the source media,
+                or a binary file object read from its current position.
+                Regular files not at their start are piped with
+                os.sendfile.
+            output_file: Path to the generated audio.
+            codec: Output audio codec.
+            bitrate: Optional manual bitrate (e.g., "128k").
+            samplerate: Optional sample rate in Hz.
+            channels: Optional number of audio channels.
+            loudnorm: Whether to apply EBU R128 loudness normalization.
+            overwrite: Overwrite existing files if True.
+        """
+        output_file = os.fsdecode(output_file)
+
+        # ffmpeg seeks the descriptor to absolute offsets, so it must be
+        # positioned at the start of the media
+        fd = None
+        if hasattr(chunks, "read"):
+            fd = _regular_fd(chunks)
+            if fd is not None and chunks.tell() != 0:
+                fd = None
+
+        samplerate, channels = self._validate_params(codec, samplerate, channels)
+        cmd = self._build_ffmpeg_command(
+            "fd:" if fd is not None else "pipe:0", output_file,
+            codec, bitrate, samplerate, channels, loudnorm,
             overwrite
         )
+        cmd[1:1] = self._STREAM_ARGS
+
+        if fd is not None:
+            with tempfile.TemporaryFile() as log:
+                proc = _spawn(
+                    cmd, stdin=fd, stdout=subprocess.DEVNULL, stderr=log)
+                proc.wait()
+                stderr_tail = _read_tail(log)
+            # ffmpeg moved the shared file offset; leave the file object
+            # at its end, as a piped copy would
+            chunks.seek(0, os.SEEK_END)
+            if proc.returncode != 0:
+                raise _command_error(cmd, stderr_tail)
+            return
+
+        # stderr goes to a file, so a chatty ffmpeg cannot block stdin and
+        # no reader thread is needed
+        with tempfile.TemporaryFile() as log:
+            proc = _spawn(
+                cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=log)
+            _enlarge_pipe(proc.stdin)
+
+            try:
+                if not hasattr(chunks, "read"):
+                    for chunk in chunks:
+                        proc.stdin.write(chunk)
+                elif not _send_file(chunks, proc.stdin):
+                    shutil.copyfileobj(chunks, proc.stdin, PIPE_SIZE)
+            except BrokenPipeError:
+                # ffmpeg exited early; its return code tells us why
+                pass
+            finally:
+                try:
+                    proc.stdin.close()
+                except BrokenPipeError:
+                    pass
+                proc.wait()
+            stderr_tail = _read_tail(log)
 
-        self._run_subprocess(cmd)
+        if proc.returncode != 0:
+            raise _command_error(cmd, stderr_tail)